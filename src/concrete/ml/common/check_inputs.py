@@ -7,7 +7,7 @@ scikit-learn to numpy types.
 import numpy
 import sklearn
 
-from ..common.debugging.custom_assert import assert_true
+from ..common.debugging.custom_assert import assert_not_reached
 
 # Disable pylint invalid name since scikit learn uses "X" as variable name for data
 # pylint: disable=invalid-name
@@ -28,7 +28,10 @@ def check_array_and_assert(X, *args, **kwargs):
         The converted and validated array
     """
     X = sklearn.utils.check_array(X, *args, **kwargs)
-    assert_true(isinstance(X, numpy.ndarray), f"wrong type {type(X)}")
+
+    # Only build the error message if the check fails, as this function is called at each predict
+    if not isinstance(X, numpy.ndarray):
+        assert_not_reached(f"wrong type {type(X)}")  # pragma: no cover
     return X
 
 
@@ -49,8 +52,12 @@ def check_X_y_and_assert(X, y, *args, **kwargs):
     """
 
     X, y = sklearn.utils.check_X_y(X, y, *args, **kwargs)
-    assert_true(isinstance(X, numpy.ndarray), f"wrong type {type(X)}")
-    assert_true(isinstance(y, numpy.ndarray), f"wrong type {type(y)}")
+
+    # Only build the error messages if the checks fail
+    if not isinstance(X, numpy.ndarray):
+        assert_not_reached(f"wrong type {type(X)}")  # pragma: no cover
+    if not isinstance(y, numpy.ndarray):
+        assert_not_reached(f"wrong type {type(y)}")  # pragma: no cover
     return X, y
 
 
@@ -48,8 +48,6 @@ def remove_unused_constant_nodes(onnx_model: onnx.ModelProto):
         onnx_model.graph.node.remove(node)
 
 
-# This algorithm needs to be improved, currently it runs in O(N^2)
-# FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/410
 def remove_identity_nodes(onnx_model: onnx.ModelProto):
     """Remove identity nodes from a model.
 
@@ -57,22 +55,25 @@ def remove_identity_nodes(onnx_model: onnx.ModelProto):
         onnx_model (onnx.ModelProto): the model for which we want to remove Identity nodes.
     """
 
-    # This is a very sub-optimal O(N^2) implementation that needs to be improved
-    node_idx = 0
-    while node_idx < len(onnx_model.graph.node):
-        node = onnx_model.graph.node[node_idx]
+    # Map the output of each Identity node to the tensor it forwards. As nodes are in topological
+    # order, an Identity node's input has always been re-routed before the node itself is reached,
+    # which makes chains of Identity nodes resolve in a single pass
+    identity_inputs = {}
+    kept_nodes = []
+
+    for node in onnx_model.graph.node:
+        for input_idx, input_ in enumerate(node.input):
+            if input_ in identity_inputs:
+                node.input[input_idx] = identity_inputs[input_]
+
         if node.op_type == "Identity":
-            identity_input = node.input[0]
-            identity_output = node.output[0]
-            # We can only look at the end of the graph as nodes are in topological order
-            # flake8 has this unresolved issue: https://github.com/PyCQA/pycodestyle/issues/373
-            for next_nodes in onnx_model.graph.node[node_idx + 1 :]:  # noqa: E203
-                for input_idx, input_ in enumerate(next_nodes.input):
-                    if input_ == identity_output:
-                        next_nodes.input[input_idx] = identity_input
-            onnx_model.graph.node.pop(node_idx)
+            identity_inputs[node.output[0]] = node.input[0]
         else:
-            node_idx += 1
+            kept_nodes.append(node)
+
+    # Rebuild the node list once, as deleting nodes one by one shifts the repeated field each time
+    del onnx_model.graph.node[:]
+    onnx_model.graph.node.extend(kept_nodes)
 
 
 def keep_following_outputs_discard_others(
@@ -375,8 +375,19 @@ def numpy_softmax(x, axis=1, keepdims=True):
     Returns:
         Tuple[numpy.ndarray]: Output tensor
     """
-    x = numpy.exp(x)
-    x /= numpy.sum(x, axis=axis, keepdims=keepdims)
+    # Subtract the maximum value along the axis before applying the exponential in order to avoid
+    # overflows, which does not change the result. This creates a new floating point array (even for
+    # integer inputs), on which both the exponential and the normalization are then applied in place
+    x = numpy.subtract(
+        x,
+        numpy.max(x, axis=axis, keepdims=True),
+        dtype=numpy.result_type(x.dtype, numpy.float32),
+    )
+    numpy.exp(x, out=x)
+
+    # Normalize by multiplying with the sums' inverses, which only requires a division per sum
+    # instead of one per element
+    x *= numpy.reciprocal(numpy.sum(x, axis=axis, keepdims=keepdims))
     return (x,)
 
 
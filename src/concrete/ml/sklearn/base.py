@@ -7,7 +7,6 @@ import tempfile
 # Disable pylint as some names like X and q_X are used, following scikit-Learn's standard. The file
 # is also more than 1000 lines long.
 # pylint: disable=too-many-lines,invalid-name
-import warnings
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import IO, Any, Callable, Dict, List, Optional, Set, Type, Union
@@ -23,11 +22,12 @@ from concrete.fhe.compilation.circuit import Circuit
 from concrete.fhe.compilation.compiler import Compiler
 from concrete.fhe.compilation.configuration import Configuration
 from concrete.fhe.dtypes.integer import Integer
+from onnx import numpy_helper
 from sklearn.base import clone
 from skorch.net import NeuralNet as SkorchNeuralNet
 
 from ..common.check_inputs import check_array_and_assert, check_X_y_and_assert_multi_output
-from ..common.debugging.custom_assert import assert_true
+from ..common.debugging.custom_assert import assert_not_reached, assert_true
 from ..common.serialization.encoder import CustomEncoder
 from ..common.utils import (
     FheMode,
@@ -44,6 +44,7 @@ from ..onnx.ops_impl import numpy_sigmoid, numpy_softmax
 from ..quantization import PostTrainingQATImporter, QuantizedArray, get_n_bits_dict
 from ..quantization.quantized_module import QuantizedModule, _get_inputset_generator
 from ..quantization.quantizers import (
+    MinMaxQuantizationStats,
     QuantizationOptions,
     UniformQuantizationParameters,
     UniformQuantizer,
@@ -52,12 +53,6 @@ from ..torch import NumpyModule
 from .qnn_module import SparseQuantNeuralNetwork
 from .tree_to_numpy import tree_to_numpy
 
-# Disable pylint to import Hummingbird while ignoring the warnings
-# pylint: disable=wrong-import-position,wrong-import-order
-# Silence Hummingbird warnings
-warnings.filterwarnings("ignore")
-from hummingbird.ml import convert as hb_convert  # noqa: E402
-
 _ALL_SKLEARN_MODELS: Set[Type] = set()
 _LINEAR_MODELS: Set[Type] = set()
 _TREE_MODELS: Set[Type] = set()
@@ -83,6 +78,10 @@ Target = Union[
 # Define QNN's attribute that will be auto-generated when fitting
 QNN_AUTO_KWARGS = ["module__n_outputs", "module__input_dim"]
 
+# Define the number of samples linear classifiers process at once when predicting probabilities, so
+# that each chunk's confidence scores are still in cache when they are post-processed
+LINEAR_PREDICT_PROBA_CHUNK_SIZE = 4096
+
 
 # pylint: disable=too-many-public-methods
 class BaseEstimator:
@@ -499,13 +498,29 @@ class BaseEstimator:
         Returns:
             np.ndarray: The predicted values for X.
         """
-        assert_true(
-            FheMode.is_valid(fhe),
-            "`fhe` mode is not supported. Expected one of 'disable' (resp. FheMode.DISABLE), "
-            "'simulate' (resp. FheMode.SIMULATE) or 'execute' (resp. FheMode.EXECUTE). Got "
-            f"{fhe}",
-            ValueError,
-        )
+        X = self._check_predict_inputs(X, fhe=fhe)
+
+        return self._predict_checked_inputs(X, fhe=fhe)
+
+    def _check_predict_inputs(self, X: Data, fhe: Union[FheMode, str]) -> numpy.ndarray:
+        """Check that the model and inputs can be used for prediction.
+
+        Args:
+            X (Data): The input values to predict, as a Numpy array, Torch tensor, Pandas DataFrame
+                or List.
+            fhe (Union[FheMode, str]): The mode to use for prediction.
+
+        Returns:
+            numpy.ndarray: The checked inputs, as a 2D Numpy array.
+        """
+        # Only build the error message when the mode is invalid, as f-strings are formatted eagerly
+        if not FheMode.is_valid(fhe):
+            assert_not_reached(
+                "`fhe` mode is not supported. Expected one of 'disable' (resp. FheMode.DISABLE), "
+                "'simulate' (resp. FheMode.SIMULATE) or 'execute' (resp. FheMode.EXECUTE). Got "
+                f"{fhe}",
+                ValueError,
+            )
 
         # Check that the model is properly fitted
         self.check_model_is_fitted()
@@ -517,6 +532,18 @@ class BaseEstimator:
         # Check that X's type and shape are supported
         X = check_array_and_assert(X)
 
+        return X
+
+    def _predict_checked_inputs(self, X: numpy.ndarray, fhe: Union[FheMode, str]) -> numpy.ndarray:
+        """Predict values for X, which have already been checked using `_check_predict_inputs`.
+
+        Args:
+            X (numpy.ndarray): The checked input values to predict.
+            fhe (Union[FheMode, str]): The mode to use for prediction.
+
+        Returns:
+            np.ndarray: The predicted values for X.
+        """
         # Quantize the input
         q_X = self.quantize_input(X)
 
@@ -715,13 +742,26 @@ class BaseClassifier(BaseEstimator):
         # If the predictions only has one dimension (i.e., binary classification problem), apply the
         # sigmoid operator
         if n_classes_ == 2:
-            y_preds = numpy_sigmoid(y_preds)[0]
-
             # If the prediction array is 1D (which happens with some models such as XGBCLassifier
             # models), transform the output into a 2D array [1-p, p], with p the initial
-            # output probabilities
+            # output probabilities. The sigmoid is computed in place directly in the second column
+            # of a pre-allocated array in order to avoid creating any temporary arrays
             if y_preds.ndim == 1 or y_preds.shape[1] == 1:
-                y_preds = numpy.concatenate((1 - y_preds, y_preds), axis=1)
+                y_logits = y_preds.reshape(-1)
+                y_preds = numpy.empty(
+                    (y_logits.shape[0], 2), dtype=numpy.result_type(y_logits.dtype, numpy.float32)
+                )
+
+                y_proba = y_preds[:, 1]
+                numpy.negative(y_logits, out=y_proba)
+                numpy.exp(y_proba, out=y_proba)
+                y_proba += 1
+                numpy.reciprocal(y_proba, out=y_proba)
+
+                numpy.subtract(1, y_proba, out=y_preds[:, 0])
+
+            else:
+                y_preds = numpy_sigmoid(y_preds)[0]
 
         # Else, apply the softmax operator
         else:
@@ -903,9 +943,10 @@ class QuantizedTorchEstimatorMixin(BaseEstimator):
         # Export the brevitas model to ONNX
         output_onnx_file_path = Path(tempfile.mkstemp(suffix=".onnx")[1])
 
+        # Only the shape of a single input sample is needed for tracing the model
         BrevitasONNXManager.export(
             self.base_module,
-            input_shape=X[[0], ::].shape,
+            input_shape=(1, X.shape[1]),
             export_path=str(output_onnx_file_path),
             keep_initializers_as_inputs=False,
             opset_version=OPSET_VERSION_FOR_ONNX_EXPORT,
@@ -915,8 +956,9 @@ class QuantizedTorchEstimatorMixin(BaseEstimator):
 
         output_onnx_file_path.unlink()
 
-        # Create corresponding numpy model
-        numpy_model = NumpyModule(onnx_model, torch.tensor(X[[0], ::]))
+        # Create corresponding numpy model. No dummy input is needed as the model is already
+        # exported to ONNX
+        numpy_model = NumpyModule(onnx_model)
 
         self.onnx_model_ = numpy_model.onnx_model
 
@@ -1387,20 +1429,66 @@ class SklearnLinearModelMixin(BaseEstimator, sklearn.base.BaseEstimator, ABC):
         BaseEstimator.__init__(self)
 
     def _set_onnx_model(self, test_input: numpy.ndarray) -> None:
-        """Retrieve the model's ONNX graph using Hummingbird conversion.
+        """Build the model's ONNX graph.
+
+        Linear models' inference is a single Gemm operator. The graph is therefore directly built
+        from the fitted weights instead of using Hummingbird's conversion, which traces the model
+        through Torch.
 
         Args:
-            test_input (numpy.ndarray): An input data used to trace the model execution.
+            test_input (numpy.ndarray): An input data used to retrieve the inputs' shape and dtype.
         """
         # Check that the underlying sklearn model has been set and fit
         assert self.sklearn_model is not None, self._sklearn_model_is_not_fitted_error_message()
 
-        self.onnx_model_ = hb_convert(
-            self.sklearn_model,
-            backend="onnx",
-            test_input=test_input,
-            extra_config={"onnx_target_opset": OPSET_VERSION_FOR_ONNX_EXPORT},
-        ).model
+        # Follow the same tensor and graph names as the graphs exported through Hummingbird
+        input_name = "input_0"
+        weights_name = "_operators.0.coefficients"
+        bias_name = "_operators.0.intercepts"
+        output_name = "variable"
+
+        # The Gemm operator expects weights of shape (n_features, n_targets) and a bias that can be
+        # broadcast to (n_samples, n_targets)
+        weights = numpy.atleast_2d(self.sklearn_model.coef_).T.astype(numpy.float32)
+        bias = numpy.atleast_1d(self.sklearn_model.intercept_).astype(numpy.float32)
+
+        gemm_node = onnx.helper.make_node(
+            "Gemm",
+            inputs=[input_name, weights_name, bias_name],
+            outputs=[output_name],
+            alpha=1.0,
+            beta=1.0,
+        )
+
+        graph = onnx.helper.make_graph(
+            nodes=[gemm_node],
+            name="torch_jit",
+            inputs=[
+                onnx.helper.make_tensor_value_info(
+                    input_name,
+                    onnx.helper.np_dtype_to_tensor_dtype(test_input.dtype),
+                    ["sym", test_input.shape[1]],
+                )
+            ],
+            outputs=[
+                onnx.helper.make_tensor_value_info(
+                    output_name, onnx.TensorProto.FLOAT, ["sym", weights.shape[1]]
+                )
+            ],
+            initializer=[
+                numpy_helper.from_array(weights, weights_name),
+                numpy_helper.from_array(bias, bias_name),
+            ],
+        )
+
+        # Fix the IR version to the one used by the Hummingbird export instead of letting ONNX pick
+        # the one of the installed release, so that the model does not depend on the environment
+        self.onnx_model_ = onnx.helper.make_model(
+            graph,
+            opset_imports=[onnx.helper.make_opsetid("", OPSET_VERSION_FOR_ONNX_EXPORT)],
+            ir_version=7,
+            producer_name="concrete-ml",
+        )
 
         self._clean_graph()
 
@@ -1433,9 +1521,20 @@ class SklearnLinearModelMixin(BaseEstimator, sklearn.base.BaseEstimator, ABC):
         input_n_bits = n_bits["op_inputs"]
         input_options = QuantizationOptions(n_bits=input_n_bits, is_signed=True)
 
-        # Quantize the inputs and store the associated quantizer
-        q_inputs = QuantizedArray(n_bits=input_n_bits, values=X, options=input_options)
-        input_quantizer = q_inputs.quantizer
+        # Calibrate the input quantizer directly on the inputs and store it. Building a
+        # QuantizedArray here would deep-copy X and quantize it entirely while only the quantizer
+        # is needed. Additionally, inputs are quantized using post-training quantization, which
+        # only requires their range: the unique values, only used for QAT, are thus not computed
+        # as this would require sorting the entire training set
+        assert_true(
+            numpy.issubdtype(X.dtype, numpy.floating),
+            f"Values must be float, got {X.dtype}",
+        )
+        input_stats = MinMaxQuantizationStats(
+            rmax=numpy.max(X), rmin=numpy.min(X), uvalues=numpy.array([])
+        )
+        input_quantizer = UniformQuantizer(options=input_options, stats=input_stats)
+        input_quantizer.compute_quantization_parameters(input_options, input_stats)
         self.input_quantizers.append(input_quantizer)
 
         weights_n_bits = n_bits["op_weights"]
@@ -1443,11 +1542,11 @@ class SklearnLinearModelMixin(BaseEstimator, sklearn.base.BaseEstimator, ABC):
 
         # Quantize the weights and store the associated quantizer
         # Transpose and expand are necessary in order to make sure the weight array has the correct
-        # shape when calling the Gemm operator on it
-        weights = self.sklearn_model.coef_.T
+        # shape, (n_features, n_targets), when calling the Gemm operator on it
+        weights = numpy.atleast_2d(self.sklearn_model.coef_).T
         q_weights = QuantizedArray(
             n_bits=n_bits["op_weights"],
-            values=numpy.expand_dims(weights, axis=1) if len(weights.shape) == 1 else weights,
+            values=weights,
             options=weight_options,
         )
         self._q_weights = q_weights.qvalues
@@ -1590,6 +1689,48 @@ class SklearnLinearClassifierMixin(
         return y_preds
 
     def predict_proba(self, X: Data, fhe: Union[FheMode, str] = FheMode.DISABLE) -> numpy.ndarray:
-        y_logits = self.decision_function(X, fhe=fhe)
-        y_proba = self.post_processing(y_logits)
+        # Check the inputs only once, which also makes it possible to split them into chunks
+        X = self._check_predict_inputs(X, fhe=fhe)
+
+        n_samples = X.shape[0]
+        y_proba: Optional[numpy.ndarray] = None
+
+        # Compute and post-process the confidence scores chunk by chunk
+        for start in range(0, n_samples, LINEAR_PREDICT_PROBA_CHUNK_SIZE):
+            end = start + LINEAR_PREDICT_PROBA_CHUNK_SIZE
+
+            # Similarly to `decision_function`, confidence scores are the dot product's output
+            # values, without any post-processing
+            y_logits = self._predict_checked_inputs(X[start:end], fhe=fhe)
+            y_proba_chunk = self.post_processing(y_logits)
+
+            # Allocate the output array once the probabilities' shape and dtype are known
+            if y_proba is None:
+                y_proba = numpy.empty(
+                    (n_samples,) + y_proba_chunk.shape[1:], dtype=y_proba_chunk.dtype
+                )
+
+            y_proba[start:end] = y_proba_chunk
+
+        assert y_proba is not None
         return y_proba
+
+    def predict(self, X: Data, fhe: Union[FheMode, str] = FheMode.DISABLE) -> numpy.ndarray:
+        # Since the sigmoid and softmax functions are monotonic, the class with the highest
+        # probability can directly be retrieved from the confidence scores, without applying any
+        # post-processing
+        y_logits = self.decision_function(X, fhe=fhe)
+
+        # If the scores only have a single column (i.e., binary classification problem), the
+        # positive class is predicted if its probability is strictly above 0.5, which is equivalent
+        # to having a strictly positive score
+        if y_logits.ndim == 1 or y_logits.shape[1] == 1:
+            y_preds = (y_logits.reshape(-1) > 0).astype(numpy.int64)
+
+        # Else, retrieve the class with the highest score
+        else:
+            y_preds = numpy.argmax(y_logits, axis=1)
+
+        assert self.target_classes_ is not None, self._is_not_fitted_error_message()
+
+        return self.target_classes_[y_preds]
@@ -17,14 +17,6 @@ from ..onnx.onnx_model_manipulations import clean_graph_at_node_op_type, remove_
 from ..quantization import QuantizedArray
 from ..quantization.quantizers import UniformQuantizer
 
-# pylint: disable=wrong-import-position,wrong-import-order
-
-# Silence Hummingbird warnings
-warnings.filterwarnings("ignore")
-from hummingbird.ml import convert as hb_convert  # noqa: E402
-
-# pylint: enable=wrong-import-position,wrong-import-order
-
 # pylint: disable=too-many-branches
 
 
@@ -44,6 +36,11 @@ def get_onnx_model(model: Callable, x: numpy.ndarray, framework: str) -> onnx.Mo
     # Silence Hummingbird warnings
     warnings.filterwarnings("ignore")
 
+    # Hummingbird is only needed for converting tree-based models and is therefore imported here in
+    # order to avoid its import cost when importing Concrete ML's other models
+    # pylint: disable-next=import-outside-toplevel
+    from hummingbird.ml import convert as hb_convert
+
     extra_config = {
         "tree_implementation": "gemm",
         "onnx_target_opset": OPSET_VERSION_FOR_ONNX_EXPORT,
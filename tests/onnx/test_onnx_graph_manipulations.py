@@ -4,7 +4,10 @@ import onnx
 from onnx import helper
 
 from concrete.ml.onnx.convert import OPSET_VERSION_FOR_ONNX_EXPORT
-from concrete.ml.onnx.onnx_model_manipulations import remove_unused_constant_nodes
+from concrete.ml.onnx.onnx_model_manipulations import (
+    remove_identity_nodes,
+    remove_unused_constant_nodes,
+)
 
 
 def test_remove_unused_constant_nodes():
@@ -80,3 +83,44 @@ def test_remove_unused_constant_nodes():
     # Check that used_constant is still in the graph while unused_constant has been removed
     assert "used_constant" in set(node.output[0] for node in model_def.graph.node)
     assert "unused_constant" not in set(node.output[0] for node in model_def.graph.node)
+
+
+def test_remove_identity_nodes():
+    """Test remove_identity_nodes"""
+
+    identity_node = helper.make_node(
+        "Identity", inputs=["input"], outputs=["identity"], name="identity_node"
+    )
+
+    other_identity_node = helper.make_node(
+        "Identity", inputs=["identity"], outputs=["other_identity"], name="other_identity_node"
+    )
+
+    relu_node = helper.make_node(
+        "Relu", inputs=["other_identity"], outputs=["output"], name="relu_node"
+    )
+
+    input_ = helper.make_tensor_value_info("input", onnx.TensorProto.FLOAT, (2,))
+    output = helper.make_tensor_value_info("output", onnx.TensorProto.FLOAT, (2,))
+
+    graph_def = helper.make_graph(
+        nodes=[identity_node, other_identity_node, relu_node],
+        name="test_remove_identities",
+        inputs=[input_],
+        outputs=[output],
+        initializer=[],
+    )
+
+    # Create the model (ModelProto)
+    model_def = helper.make_model(graph_def, producer_name="onnx-example")
+    model_def.opset_import[0].version = OPSET_VERSION_FOR_ONNX_EXPORT
+
+    onnx.checker.check_model(model_def)
+
+    remove_identity_nodes(model_def)
+
+    onnx.checker.check_model(model_def)
+
+    # Check that both Identity nodes have been removed and that the chain has been re-routed
+    assert [node.op_type for node in model_def.graph.node] == ["Relu"]
+    assert list(model_def.graph.node[0].input) == ["input"]
@@ -2,7 +2,7 @@
 import numpy
 import pytest
 
-from concrete.ml.onnx.ops_impl import numpy_gemm, onnx_func_raw_args
+from concrete.ml.onnx.ops_impl import numpy_gemm, numpy_softmax, onnx_func_raw_args
 
 
 @pytest.mark.parametrize(
@@ -61,6 +61,24 @@ def test_numpy_gemm(alpha, beta, trans_a, size_a, trans_b, size_b):
         ), f"expected {expected}, got {got}, abs diff is {numpy.abs(got - expected)}"
 
 
+@pytest.mark.parametrize("dtype", [numpy.float64, numpy.int64])
+@pytest.mark.parametrize("offset", [0, 1000])
+def test_numpy_softmax(offset, dtype):
+    """Test numpy_softmax, including on large values that would overflow a naive exponential."""
+    x = numpy.random.uniform(-5, 5, size=(10, 4)).astype(dtype)
+
+    expected_exp = numpy.exp(x)
+    expected = expected_exp / numpy.sum(expected_exp, axis=1, keepdims=True)
+
+    # Softmax is invariant to a constant shift of its inputs
+    (got,) = numpy_softmax(x + offset)
+
+    # Integer inputs are computed in float64, as for numpy.exp
+    assert got.dtype == numpy.result_type(dtype, numpy.float32)
+    assert numpy.all(numpy.isfinite(got))
+    assert numpy.allclose(got, expected), f"expected {expected}, got {got}"
+
+
 def test_raw_argument_impl():
     """Test ONNX implementation function semantics."""
 
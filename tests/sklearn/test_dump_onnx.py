@@ -10,7 +10,7 @@ from sklearn.exceptions import ConvergenceWarning
 
 from concrete.ml.common.utils import is_model_class_in_a_list
 from concrete.ml.pytest.utils import get_model_name, sklearn_models_and_datasets
-from concrete.ml.sklearn import get_sklearn_tree_models
+from concrete.ml.sklearn import get_sklearn_linear_models, get_sklearn_tree_models
 
 # Remark that the dump tests for torch module is directly done in test_compile_torch.py
 
@@ -58,6 +58,11 @@ def check_onnx_file_dump(model_class, parameters, load_data, str_expected, defau
         while len(onnx_model.graph.initializer) > 0:
             del onnx_model.graph.initializer[0]
 
+    # Linear models' graphs are built by Concrete ML, which should not depend on the ONNX release
+    if is_model_class_in_a_list(model_class, get_sklearn_linear_models()):
+        assert onnx_model.ir_version == 7
+        assert onnx_model.producer_name == "concrete-ml"
+
     str_model = onnx.helper.printable_graph(onnx_model.graph)
     print(f"{model_name}:")
     print(str_model)
@@ -67,9 +72,9 @@ def check_onnx_file_dump(model_class, parameters, load_data, str_expected, defau
         model_class, get_sklearn_tree_models(str_in_class_name="RandomForest")
     ):
         # The expected graph is usually a string and we therefore directly test if it is equal to
-        # the retrieved graph's string. However, in some cases such as for TweedieRegressor models,
-        # this graph can slightly changed depending on some input's values. We then expected the
-        # string to match as least one of them expected strings (as a list)
+        # the retrieved graph's string. However, in some cases, this graph can slightly changed
+        # depending on some input's values. We then expected the string to match as least one of
+        # them expected strings (as a list)
         if isinstance(str_expected, str):
             assert str_model == str_expected
         else:
@@ -102,8 +107,8 @@ def test_dump(
   %_operators.0.coefficients[FLOAT, 10x1]
   %_operators.0.intercepts[FLOAT, 1]
 ) {
-  %/_operators.0/Gemm_output_0 = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
-  return %/_operators.0/Gemm_output_0
+  %variable = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
+  return %variable
 }""",
         "NeuralNetClassifier": """graph torch_jit (
   %inp.1[FLOAT, 1x10]
@@ -177,8 +182,8 @@ def test_dump(
   %_operators.0.coefficients[FLOAT, 10x1]
   %_operators.0.intercepts[FLOAT, 1]
 ) {
-  %/_operators.0/Gemm_output_0 = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
-  return %/_operators.0/Gemm_output_0
+  %variable = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
+  return %variable
 }""",
         "DecisionTreeRegressor": """graph torch_jit (
   %input_0[DOUBLE, symx10]
@@ -224,20 +229,10 @@ def test_dump(
   %_operators.0.coefficients[FLOAT, 10x1]
   %_operators.0.intercepts[FLOAT, 1]
 ) {
-  %/_operators.0/Gemm_output_0 = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
-  return %/_operators.0/Gemm_output_0
-}""",
-        "TweedieRegressor": [
-            """graph torch_jit (
-  %input_0[DOUBLE, symx10]
-) initializers (
-  %_operators.0.coefficients[FLOAT, 10x1]
-  %_operators.0.intercepts[FLOAT, 1]
-) {
-  %/_operators.0/Gemm_output_0 = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
-  return %/_operators.0/Gemm_output_0
+  %variable = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
+  return %variable
 }""",
-            """graph torch_jit (
+        "TweedieRegressor": """graph torch_jit (
   %input_0[DOUBLE, symx10]
 ) initializers (
   %_operators.0.coefficients[FLOAT, 10x1]
@@ -246,7 +241,6 @@ def test_dump(
   %variable = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
   return %variable
 }""",
-        ],
         "Ridge": """graph torch_jit (
   %input_0[DOUBLE, symx10]
 ) initializers (
@@ -281,8 +275,8 @@ def test_dump(
   %_operators.0.coefficients[FLOAT, 10x1]
   %_operators.0.intercepts[FLOAT, 1]
 ) {
-  %/_operators.0/Gemm_output_0 = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
-  return %/_operators.0/Gemm_output_0
+  %variable = Gemm[alpha = 1, beta = 1](%input_0, %_operators.0.coefficients, %_operators.0.intercepts)
+  return %variable
 }""",
         "ElasticNet": """graph torch_jit (
   %input_0[DOUBLE, symx10]
@@ -109,6 +109,18 @@ N_BITS_WEEKLY_ONLY_BUILDS = [2, 8, 16]
 # the CRT.
 N_BITS_THRESHOLD_FOR_CRT_FHE_CIRCUITS = 9
 
+# Linear models and their data-sets, for tests that target their specific methods
+_linear_models_and_datasets = [
+    model_and_dataset
+    for model_and_dataset in sklearn_models_and_datasets
+    if is_model_class_in_a_list(model_and_dataset.values[0], get_sklearn_linear_models())
+]
+_linear_classifiers_and_datasets = [
+    model_and_dataset
+    for model_and_dataset in _linear_models_and_datasets
+    if is_classifier_or_partial_classifier(model_and_dataset.values[0])
+]
+
 
 def get_dataset(model_class, parameters, n_bits, load_data, is_weekly_option):
     """Prepare the the (x, y) data-set."""
@@ -812,6 +824,10 @@ def check_fitted_compiled_error_raises(model_class, n_bits, x, y):
         with pytest.raises(AttributeError, match=".* model is not compiled.*"):
             model.predict_proba(x, fhe="execute")
 
+    # Predicting with an unsupported FHE mode should not be possible
+    with pytest.raises(ValueError, match="`fhe` mode is not supported.*"):
+        model.predict(x, fhe="unsupported_mode")
+
 
 def check_class_mapping(model, x, y):
     """Check that classes with arbitrary labels are handled for all classifiers."""
@@ -850,6 +866,42 @@ def check_class_mapping(model, x, y):
     numpy.array_equal(classes[y_pred], y_pred_shuffled)
 
 
+def check_linear_predict_with_custom_labels(model, x, y):
+    """Check that linear classifiers predict the most probable class for arbitrary labels."""
+
+    # Map each target to a custom label that does not match its class index
+    labels = numpy.arange(len(numpy.unique(y))) * 3 + 5
+    new_y = labels[y]
+
+    # Fit the model using these new targets
+    with warnings.catch_warnings():
+        # Sometimes, we miss convergence, which is not a problem for our test
+        warnings.simplefilter("ignore", category=ConvergenceWarning)
+        model.fit(x, new_y)
+
+    assert numpy.array_equal(model.target_classes_, labels)
+
+    # Predictions are computed from the confidence scores while the expected classes are retrieved
+    # from the probabilities
+    y_pred = model.predict(x)
+    y_pred_expected = model.target_classes_[numpy.argmax(model.predict_proba(x), axis=1)]
+
+    assert numpy.array_equal(y_pred, y_pred_expected)
+
+
+def check_linear_predict_proba_chunks(model, x, fhe):
+    """Check that linear classifiers' probabilities do not depend on how samples are chunked."""
+
+    # Compute the probabilities chunk by chunk
+    y_proba = model.predict_proba(x, fhe=fhe)
+
+    # Compute the probabilities of all samples at once
+    y_proba_expected = model.post_processing(model.decision_function(x, fhe=fhe))
+
+    assert y_proba.shape == y_proba_expected.shape
+    numpy.testing.assert_allclose(y_proba, y_proba_expected)
+
+
 @pytest.mark.parametrize("model_class, parameters", sklearn_models_and_datasets)
 @pytest.mark.parametrize(
     "n_bits",
@@ -1347,3 +1399,79 @@ def test_class_mapping(
         print("Run check_class_mapping")
 
     check_class_mapping(model, x, y)
+
+
+@pytest.mark.parametrize("model_class, parameters", _linear_classifiers_and_datasets)
+@pytest.mark.parametrize("fhe", ["disable", "simulate"])
+def test_linear_predict_proba_chunks(
+    model_class,
+    parameters,
+    fhe,
+    load_data,
+    default_configuration,
+    is_weekly_option,
+    monkeypatch,
+    verbose=True,
+):
+    """Test that linear classifiers' probabilities are correctly computed across chunks."""
+    n_bits = min(N_BITS_REGULAR_BUILDS)
+
+    model, x = preamble(model_class, parameters, n_bits, load_data, is_weekly_option)
+
+    # Only keep a few samples in order to make the simulation faster
+    x = x[:100]
+
+    if fhe == "simulate":
+        model.compile(x, default_configuration)
+
+    # Use a chunk size that does not divide the number of samples so that the last chunk is smaller
+    # than the others
+    monkeypatch.setattr("concrete.ml.sklearn.base.LINEAR_PREDICT_PROBA_CHUNK_SIZE", 7)
+
+    if verbose:
+        print("Run check_linear_predict_proba_chunks")
+
+    check_linear_predict_proba_chunks(model, x, fhe)
+
+
+@pytest.mark.parametrize("model_class, parameters", _linear_classifiers_and_datasets)
+def test_linear_predict_with_custom_labels(
+    model_class,
+    parameters,
+    load_data,
+    is_weekly_option,
+    verbose=True,
+):
+    """Test that linear classifiers' predictions match their probabilities."""
+    n_bits = min(N_BITS_REGULAR_BUILDS)
+
+    x, y = get_dataset(model_class, parameters, n_bits, load_data, is_weekly_option)
+
+    model = instantiate_model_generic(model_class, n_bits=n_bits)
+
+    if verbose:
+        print("Run check_linear_predict_with_custom_labels")
+
+    check_linear_predict_with_custom_labels(model, x, y)
+
+
+@pytest.mark.parametrize("model_class, parameters", _linear_models_and_datasets)
+def test_linear_fit_integer_inputs(
+    model_class,
+    parameters,
+    load_data,
+    is_weekly_option,
+):
+    """Test that linear models can not be fitted on integer inputs."""
+    n_bits = min(N_BITS_REGULAR_BUILDS)
+
+    x, y = get_dataset(model_class, parameters, n_bits, load_data, is_weekly_option)
+
+    model = instantiate_model_generic(model_class, n_bits=n_bits)
+
+    with warnings.catch_warnings():
+        # Sometimes, we miss convergence, which is not a problem for our test
+        warnings.simplefilter("ignore", category=ConvergenceWarning)
+
+        with pytest.raises(AssertionError, match="Values must be float, got int64"):
+            model.fit(x.astype(numpy.int64), y)